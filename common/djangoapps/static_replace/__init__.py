@@ -74,6 +74,9 @@ def replace_jump_to_id_urls(text, course_id, jump_to_id_base_url):
         rest = match.group('rest')
         return "".join([quote, jump_to_id_base_url + rest, quote])
 
+    if '/jump_to_id/' not in text:
+        return text
+
     return re.sub(_url_replace_regex('/jump_to_id/'), replace_jump_to_id_url, text)
 
 
@@ -94,6 +97,9 @@ def replace_course_urls(text, course_key):
         rest = match.group('rest')
         return "".join([quote, '/courses/' + course_id + '/', rest, quote])
 
+    if '/course/' not in text:
+        return text
+
     return re.sub(_url_replace_regex('/course/'), replace_course_url, text)
 
 
@@ -124,6 +130,11 @@ def process_static_urls(text, replacement_function, data_dir=None):
 
         return replacement_function(original, prefix, quote, rest)
 
+    # The url regex is comparatively expensive to run over a whole fragment, so
+    # skip it outright when the text can't contain any static urls.
+    if u'/static/' not in text and six.text_type(settings.STATIC_URL) not in text:
+        return text
+
     return re.sub(
         _url_replace_regex(u'(?:{static_url}|/static/)(?!{data_dir})'.format(
             static_url=settings.STATIC_URL,
@@ -19,6 +19,7 @@ from static_replace import (
     make_static_urls_absolute,
     process_static_urls,
     replace_course_urls,
+    replace_jump_to_id_urls,
     replace_static_urls
 )
 from xmodule.assetstore.assetmgr import AssetManager
@@ -84,6 +85,16 @@ def test_process_url_no_match():
     assert process_static_urls(STATIC_SOURCE, processor) == '"test/static/file.png"'
 
 
+@patch('static_replace.re')
+def test_process_url_skips_text_without_static_urls(mock_re):
+    text = '<p>"/courses/file.png" and "/assets/file.png"</p>'
+
+    assert process_static_urls(text, Mock()) is text
+    assert replace_course_urls(text, COURSE_KEY) is text
+    assert replace_jump_to_id_urls(text, COURSE_KEY, '/courses/org/course/run/jump_to_id/') is text
+    assert not mock_re.sub.called
+
+
 @patch('django.http.HttpRequest', autospec=True)
 def test_static_urls(mock_request):
     mock_request.build_absolute_uri = lambda url: 'http://' + url
@@ -103,6 +103,13 @@ class ProblemBlock(
         if 'lcp' in self.__dict__:
             del self.__dict__['lcp']
 
+    def bind_for_same_student(self, *args, **kwargs):
+        super(ProblemBlock, self).bind_for_same_student(*args, **kwargs)
+
+        # bind_for_student() deletes self.lcp even when rebinding the same user, so do the same here.
+        if 'lcp' in self.__dict__:
+            del self.__dict__['lcp']
+
     def student_view(self, _context, show_detailed_errors=False):
         """
         Return the student view.
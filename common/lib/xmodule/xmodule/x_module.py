@@ -676,8 +676,7 @@ class XModuleMixin(XModuleFields, XBlock):
 
         # Skip rebinding if we're already bound a user, and it's this user.
         if self.scope_ids.user_id is not None and user_id == self.scope_ids.user_id:
-            if getattr(xmodule_runtime, 'position', None):
-                self.position = xmodule_runtime.position   # update the position of the tab
+            self.bind_for_same_student(getattr(xmodule_runtime, 'position', None))
             return
 
         # If we are switching users mid-request, save the data from the old user.
@@ -714,6 +713,20 @@ class XModuleMixin(XModuleFields, XBlock):
 
         self._field_data = wrapped_field_data
 
+    def bind_for_same_student(self, position=None):
+        """
+        Refresh this XBlock when it is bound again to the user it is already bound to.
+
+        This is all that bind_for_student does in that case, so callers that know the
+        block is already bound to the user can call it without building a new runtime.
+
+        Arguments:
+            position: The position of the tab to update to, if any
+        """
+        # pylint: disable=attribute-defined-outside-init
+        if position:
+            self.position = position   # update the position of the tab
+
     @property
     def non_editable_metadata_fields(self):
         """
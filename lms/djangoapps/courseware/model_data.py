@@ -1019,7 +1019,7 @@ def set_score(user_id, usage_key, score, max_score):
     if not created:
         student_module.grade = score
         student_module.max_grade = max_score
-        student_module.save()
+        student_module.save(update_fields=['grade', 'max_grade', 'modified'])
     return student_module.modified
 
 
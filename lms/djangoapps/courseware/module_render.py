@@ -89,6 +89,7 @@ from openedx.features.discounts.utils import offer_banner_wrapper
 from student.models import anonymous_id_for_user, user_by_anonymous_id
 from student.roles import CourseBetaTesterRole
 from track import contexts
+from track import views as track_views
 from util import milestones_helpers
 from util.json_request import JsonResponse
 from xblock_django.user_service import DjangoXBlockUserService
@@ -131,10 +132,8 @@ def make_track_function(request):
     Make a tracking function that logs what happened.
     For use in ModuleSystem.
     '''
-    import track.views
-
     def function(event_type, event):
-        return track.views.server_track(request, event_type, event, page='x_module')
+        return track_views.server_track(request, event_type, event, page='x_module')
     return function
 
 
@@ -166,6 +165,10 @@ def toc_for_course(user, request, course, active_chapter, active_section, field_
     NOTE: assumes that if we got this far, user has access to course.  Returns
     None if this is not the case.
 
+    course must have been loaded from the modulestore with at least 2 levels of its
+    descendants (e.g. depth=CONTENT_DEPTH), so that the chapters and sections below are
+    read from the already-fetched tree rather than with a modulestore query per block.
+
     field_data_cache must include data from the course module and 2 levels of its descendants
     '''
     with modulestore().bulk_operations(course.id):
@@ -187,13 +190,11 @@ def toc_for_course(user, request, course, active_chapter, active_section, field_
             required_content = [content for content in required_content if not content == course.entrance_exam_id]
 
         previous_of_active_section, next_of_active_section = None, None
-        last_processed_section, last_processed_chapter = None, None
+        last_processed_section, last_processed_chapter_url_name = None, None
         found_active_section = False
         for chapter in chapters:
             # Only show required content, if there is required content
             # chapter.hide_from_toc is read-only (bool)
-            # xss-lint: disable=python-deprecated-display-name
-            display_id = slugify(chapter.display_name_with_default_escaped)
             local_hide_from_toc = False
             if required_content:
                 if six.text_type(chapter.location) not in required_content:
@@ -203,21 +204,29 @@ def toc_for_course(user, request, course, active_chapter, active_section, field_
             if chapter.hide_from_toc or local_hide_from_toc:
                 continue
 
+            # Read the chapter's fields once, rather than once per section below
+            # xss-lint: disable=python-deprecated-display-name
+            chapter_display_name = chapter.display_name_with_default_escaped
+            chapter_url_name = chapter.url_name
+            is_chapter_active = chapter_url_name == active_chapter
+
             sections = list()
             for section in chapter.get_display_items():
                 # skip the section if it is hidden from the user
                 if section.hide_from_toc:
                     continue
 
-                is_section_active = (chapter.url_name == active_chapter and section.url_name == active_section)
+                section_url_name = section.url_name
+                section_format = section.format
+                is_section_active = is_chapter_active and section_url_name == active_section
                 if is_section_active:
                     found_active_section = True
 
                 section_context = {
                     # xss-lint: disable=python-deprecated-display-name
                     'display_name': section.display_name_with_default_escaped,
-                    'url_name': section.url_name,
-                    'format': section.format if section.format is not None else '',
+                    'url_name': section_url_name,
+                    'format': section_format if section_format is not None else '',
                     'due': section.due,
                     'active': is_section_active,
                     'graded': section.graded,
@@ -228,22 +237,21 @@ def toc_for_course(user, request, course, active_chapter, active_section, field_
                 if is_section_active:
                     if last_processed_section:
                         previous_of_active_section = last_processed_section.copy()
-                        previous_of_active_section['chapter_url_name'] = last_processed_chapter.url_name
+                        previous_of_active_section['chapter_url_name'] = last_processed_chapter_url_name
                 elif found_active_section and not next_of_active_section:
                     next_of_active_section = section_context.copy()
-                    next_of_active_section['chapter_url_name'] = chapter.url_name
+                    next_of_active_section['chapter_url_name'] = chapter_url_name
 
                 sections.append(section_context)
                 last_processed_section = section_context
-                last_processed_chapter = chapter
+                last_processed_chapter_url_name = chapter_url_name
 
             toc_chapters.append({
-                # xss-lint: disable=python-deprecated-display-name
-                'display_name': chapter.display_name_with_default_escaped,
-                'display_id': display_id,
-                'url_name': chapter.url_name,
+                'display_name': chapter_display_name,
+                'display_id': slugify(chapter_display_name),
+                'url_name': chapter_url_name,
                 'sections': sections,
-                'active': chapter.url_name == active_chapter
+                'active': is_chapter_active
             })
         return {
             'chapters': toc_chapters,
@@ -680,11 +688,13 @@ def get_module_system_for_user(
         module.runtime = inner_system
         inner_system.xmodule_instance = module
 
+    masquerading_as_specific_student = is_masquerading_as_specific_student(user, course_id)
+
     # Build a list of wrapping functions that will be applied in order
     # to the Fragment content coming out of the xblocks that are about to be rendered.
     block_wrappers = []
 
-    if is_masquerading_as_specific_student(user, course_id):
+    if masquerading_as_specific_student:
         block_wrappers.append(filter_displayed_blocks)
 
     if settings.FEATURES.get("LICENSING", False):
@@ -704,13 +714,15 @@ def get_module_system_for_user(
     # TODO (cpennington): When modules are shared between courses, the static
     # prefix is going to have to be specific to the module, not the directory
     # that the xml was loaded from
+    data_dir = getattr(descriptor, 'data_dir', None)
+    block_static_asset_path = static_asset_path or descriptor.static_asset_path
 
     # Rewrite urls beginning in /static to point to course-specific content
     block_wrappers.append(partial(
         replace_static_urls,
-        getattr(descriptor, 'data_dir', None),
+        data_dir,
         course_id=course_id,
-        static_asset_path=static_asset_path or descriptor.static_asset_path
+        static_asset_path=block_static_asset_path
     ))
 
     # Allow URLs of the form '/course/' refer to the root of multicourse directory
@@ -722,10 +734,11 @@ def get_module_system_for_user(
     # because it is agnostic to course-hierarchy.
     # NOTE: module_id is empty string here. The 'module_id' will get assigned in the replacement
     # function, we just need to specify something to get the reverse() to work.
+    jump_to_id_base_url = reverse('jump_to_id', kwargs={'course_id': text_type(course_id), 'module_id': ''})
     block_wrappers.append(partial(
         replace_jump_to_id_urls,
         course_id,
-        reverse('jump_to_id', kwargs={'course_id': text_type(course_id), 'module_id': ''}),
+        jump_to_id_base_url,
     ))
 
     block_wrappers.append(partial(display_access_messages, user))
@@ -733,7 +746,7 @@ def get_module_system_for_user(
     block_wrappers.append(partial(offer_banner_wrapper, user))
 
     if settings.FEATURES.get('DISPLAY_DEBUG_INFO_TO_STAFF'):
-        if is_masquerading_as_specific_student(user, course_id):
+        if masquerading_as_specific_student:
             # When masquerading as a specific student, we want to show the debug button
             # unconditionally to enable resetting the state of the student we are masquerading as.
             # We already know the user has staff access when masquerading is active.
@@ -784,9 +797,9 @@ def get_module_system_for_user(
         # by the replace_static_urls code below
         replace_urls=partial(
             static_replace.replace_static_urls,
-            data_directory=getattr(descriptor, 'data_dir', None),
+            data_directory=data_dir,
             course_id=course_id,
-            static_asset_path=static_asset_path or descriptor.static_asset_path,
+            static_asset_path=block_static_asset_path,
         ),
         replace_course_urls=partial(
             static_replace.replace_course_urls,
@@ -795,7 +808,7 @@ def get_module_system_for_user(
         replace_jump_to_id_urls=partial(
             static_replace.replace_jump_to_id_urls,
             course_id=course_id,
-            jump_to_id_base_url=reverse('jump_to_id', kwargs={'course_id': text_type(course_id), 'module_id': ''})
+            jump_to_id_base_url=jump_to_id_base_url
         ),
         node_path=settings.NODE_PATH,
         publish=publish,
@@ -829,14 +842,7 @@ def get_module_system_for_user(
     )
 
     # pass position specified in URL to module through ModuleSystem
-    if position is not None:
-        try:
-            position = int(position)
-        except (ValueError, TypeError):
-            log.exception(u'Non-integer %r passed as position.', position)
-            position = None
-
-    system.set('position', position)
+    system.set('position', _normalize_position(position))
 
     system.set(u'user_is_staff', user_is_staff)
     system.set(u'user_is_admin', bool(has_access(user, u'staff', 'global')))
@@ -844,7 +850,7 @@ def get_module_system_for_user(
     system.set(u'days_early_for_beta', descriptor.days_early_for_beta)
 
     # make an ErrorDescriptor -- assuming that the descriptor's system is ok
-    if has_access(user, u'staff', descriptor.location, course_id):
+    if user_is_staff:
         system.error_descriptor_class = ErrorDescriptor
     else:
         system.error_descriptor_class = NonStaffErrorDescriptor
@@ -852,6 +858,19 @@ def get_module_system_for_user(
     return system, field_data
 
 
+def _normalize_position(position):
+    """
+    Return the position specified in the URL as an int, or None if it isn't one.
+    """
+    if position is not None:
+        try:
+            position = int(position)
+        except (ValueError, TypeError):
+            log.exception(u'Non-integer %r passed as position.', position)
+            position = None
+    return position
+
+
 # TODO: Find all the places that this method is called and figure out how to
 # get a loaded course passed into it
 def get_module_for_descriptor_internal(user, descriptor, student_data, course_id,
@@ -868,35 +887,40 @@ def get_module_for_descriptor_internal(user, descriptor, student_data, course_id
         request_token (str): A unique token for this request, used to isolate xblock rendering
     """
 
-    (system, student_data) = get_module_system_for_user(
-        user=user,
-        student_data=student_data,  # These have implicit user bindings, the rest of args are considered not to
-        descriptor=descriptor,
-        course_id=course_id,
-        track_function=track_function,
-        xqueue_callback_url_prefix=xqueue_callback_url_prefix,
-        position=position,
-        wrap_xmodule_display=wrap_xmodule_display,
-        grade_bucket_type=grade_bucket_type,
-        static_asset_path=static_asset_path,
-        user_location=user_location,
-        request_token=request_token,
-        disable_staff_debug_info=disable_staff_debug_info,
-        course=course,
-        will_recheck_access=will_recheck_access,
-    )
+    if descriptor.scope_ids.user_id is not None and descriptor.scope_ids.user_id == user.id:
+        # The descriptor is already bound to this user, and bind_for_student would keep
+        # its existing runtime, so don't build a new one.
+        descriptor.bind_for_same_student(_normalize_position(position))
+    else:
+        (system, student_data) = get_module_system_for_user(
+            user=user,
+            student_data=student_data,  # These have implicit user bindings, the rest of args are considered not to
+            descriptor=descriptor,
+            course_id=course_id,
+            track_function=track_function,
+            xqueue_callback_url_prefix=xqueue_callback_url_prefix,
+            position=position,
+            wrap_xmodule_display=wrap_xmodule_display,
+            grade_bucket_type=grade_bucket_type,
+            static_asset_path=static_asset_path,
+            user_location=user_location,
+            request_token=request_token,
+            disable_staff_debug_info=disable_staff_debug_info,
+            course=course,
+            will_recheck_access=will_recheck_access,
+        )
 
-    descriptor.bind_for_student(
-        system,
-        user.id,
-        [
-            partial(DateLookupFieldData, course_id=course_id, user=user),
-            partial(OverrideFieldData.wrap, user, course),
-            partial(LmsFieldData, student_data=student_data),
-        ],
-    )
+        descriptor.bind_for_student(
+            system,
+            user.id,
+            [
+                partial(DateLookupFieldData, course_id=course_id, user=user),
+                partial(OverrideFieldData.wrap, user, course),
+                partial(LmsFieldData, student_data=student_data),
+            ],
+        )
 
-    descriptor.scope_ids = descriptor.scope_ids._replace(user_id=user.id)
+        descriptor.scope_ids = descriptor.scope_ids._replace(user_id=user.id)
 
     # Do not check access when it's a noauth request.
     # Not that the access check needs to happen after the descriptor is bound
@@ -927,21 +951,33 @@ def load_single_xblock(request, user_id, course_id, usage_key_string, course=Non
     course_key = CourseKey.from_string(course_id)
     usage_key = usage_key.map_into_course(course_key)
     user = User.objects.get(id=user_id)
+    descriptor = modulestore().get_item(usage_key)
     field_data_cache = FieldDataCache.cache_for_descriptor_descendents(
         course_key,
         user,
-        modulestore().get_item(usage_key),
+        descriptor,
         depth=0,
     )
-    instance = get_module(
-        user,
-        request,
-        usage_key,
-        field_data_cache,
-        grade_bucket_type='xqueue',
-        course=course,
-        will_recheck_access=will_recheck_access
-    )
+    # Bind the descriptor loaded above rather than going through get_module, which
+    # would fetch it from the modulestore a second time. Errors are handled as
+    # get_module handles them.
+    try:
+        instance = get_module_for_descriptor(
+            user,
+            request,
+            descriptor,
+            field_data_cache,
+            usage_key.course_key,
+            grade_bucket_type='xqueue',
+            course=course,
+            will_recheck_access=will_recheck_access
+        )
+    except ItemNotFoundError:
+        log.debug("Error in get_module: ItemNotFoundError")
+        instance = None
+    except:  # pylint: disable=W0702
+        log.exception("Error in get_module")
+        instance = None
     if instance is None:
         msg = u"No module {0} for user {1}--access denied?".format(usage_key_string, user)
         log.debug(msg)
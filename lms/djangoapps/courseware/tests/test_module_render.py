@@ -63,6 +63,7 @@ from openedx.core.djangoapps.credit.api import set_credit_requirement_status, se
 from openedx.core.djangoapps.credit.models import CreditCourse
 from openedx.core.djangoapps.oauth_dispatch.jwt import create_jwt_for_user
 from openedx.core.djangoapps.oauth_dispatch.tests.factories import ApplicationFactory, AccessTokenFactory
+from openedx.core.lib import xblock_utils
 from openedx.core.lib.courses import course_image_url
 from openedx.core.lib.gating import api as gating_api
 from openedx.core.lib.url_utils import quote_slashes
@@ -255,6 +256,21 @@ class ModuleRenderTestCase(SharedModuleStoreTestCase, LoginEnrollmentTestCase):
         # note if the URL mapping changes then this assertion will break
         self.assertIn('/courses/' + text_type(self.course_key) + '/jump_to_id/vertical_test', html)
 
+    def test_load_single_xblock_loads_descriptor_once(self):
+        """
+        load_single_xblock binds the descriptor it loaded for the FieldDataCache
+        instead of fetching it from the modulestore again.
+        """
+        user = UserFactory.create()
+        mock_request = MagicMock()
+        mock_request.user = user
+        usage_key = self.course_key.make_usage_key('html', 'toyjumpto')
+        store = modulestore()
+        with patch.object(store, 'get_item', wraps=store.get_item) as mock_get_item:
+            instance = render.load_single_xblock(mock_request, user.id, text_type(self.course_key), text_type(usage_key))
+        self.assertEqual(instance.location, usage_key)
+        self.assertEqual(mock_get_item.call_count, 1)
+
     def test_xqueue_callback_success(self):
         """
         Test for happy-path xqueue_callback
@@ -2000,6 +2016,64 @@ class TestStaffDebugInfo(SharedModuleStoreTestCase):
             module.render(STUDENT_VIEW)
             self.assertTrue(mock_grade_histogram.called)
 
+    def test_staff_debug_modal_rendered_when_staff_debug_info_disabled(self):
+        """
+        Disabling staff debug info only hides the trigger links; the debug modal,
+        with the field values and histogram, is still rendered.
+        """
+        descriptor = modulestore().get_item(self.location)
+        with patch('openedx.core.lib.xblock_utils.grade_histogram') as mock_grade_histogram:
+            mock_grade_histogram.return_value = []
+            module = render.get_module_for_descriptor(
+                self.user,
+                self.request,
+                descriptor,
+                self.field_data_cache,
+                self.location.course_key,
+                disable_staff_debug_info=True,
+            )
+            result_fragment = module.render(STUDENT_VIEW)
+            self.assertNotIn('Staff Debug Info', result_fragment.content)
+            self.assertIn('Staff Debug: Option Response Problem', result_fragment.content)
+            self.assertTrue(mock_grade_histogram.called)
+
+    def test_histograms_for_sibling_problems_fetched_once(self):
+        """
+        Rendering a vertical with several scored problems fetches all of their
+        histograms with a single query.
+        """
+        vertical = ItemFactory.create(category='vertical', parent_location=self.course.location)
+        problem_xml = OptionResponseXMLFactory().build_xml(
+            question_text='The correct answer is Correct',
+            num_inputs=2,
+            weight=2,
+            options=['Correct', 'Incorrect'],
+            correct_option='Correct'
+        )
+        problems = [
+            ItemFactory.create(category='problem', parent_location=vertical.location, data=problem_xml)
+            for __ in range(2)
+        ]
+        field_data_cache = FieldDataCache.cache_for_descriptor_descendents(
+            self.course.id,
+            self.user,
+            modulestore().get_item(vertical.location, depth=None),
+        )
+        with patch(
+            'openedx.core.lib.xblock_utils.grade_histograms', wraps=xblock_utils.grade_histograms
+        ) as mock_grade_histograms:
+            module = render.get_module(
+                self.user,
+                self.request,
+                vertical.location,
+                field_data_cache,
+            )
+            module.render(STUDENT_VIEW)
+        self.assertEqual(mock_grade_histograms.call_count, 1)
+        self.assertEqual(
+            set(text_type(module_id) for module_id in mock_grade_histograms.call_args[0][0]),
+            set(text_type(problem.location) for problem in problems),
+        )
 
 PER_COURSE_ANONYMIZED_DESCRIPTORS = (LTIDescriptor, )
 PER_STUDENT_ANONYMIZED_XBLOCKS = [
@@ -2334,6 +2408,25 @@ class TestRebindModule(TestSubmittingProblems):
         user3 = UserFactory.create()
         module.bind_for_student(module.system, user3.id)
 
+    def test_get_module_for_bound_problem(self):
+        """
+        Getting a module for a problem already bound to the user keeps its
+        runtime, but still drops the cached LoncapaProblem like bind_for_student.
+        """
+        module = self.get_module_for_user(self.user, self.problem)
+        runtime = module.xmodule_runtime
+        self.assertIsNotNone(module.lcp)
+
+        mock_request = MagicMock()
+        mock_request.user = self.user
+        field_data_cache = FieldDataCache.cache_for_descriptor_descendents(
+            self.course.id, self.user, self.course, depth=2)
+        rebound = render.get_module_for_descriptor(self.user, mock_request, module, field_data_cache, self.course.id)
+
+        self.assertIs(rebound, module)
+        self.assertIs(rebound.xmodule_runtime, runtime)
+        self.assertNotIn('lcp', rebound.__dict__)
+
     def test_rebind_noauth_module_to_user_not_anonymous(self):
         """
         Tests that an exception is thrown when rebind_noauth_module_to_user is run from a
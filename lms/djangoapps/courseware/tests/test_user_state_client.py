@@ -4,11 +4,15 @@ defined in edx_user_state_client.
 """
 
 
+import json
 from collections import defaultdict
 
+from django.test import TestCase
 from edx_user_state_client.tests import UserStateClientTestBase
+from opaque_keys.edx.locator import CourseLocator
 
-from lms.djangoapps.courseware.tests.factories import UserFactory
+from lms.djangoapps.courseware.models import StudentModule
+from lms.djangoapps.courseware.tests.factories import StudentModuleFactory, UserFactory
 from lms.djangoapps.courseware.user_state_client import DjangoXBlockUserStateClient
 from xmodule.modulestore.tests.django_utils import ModuleStoreTestCase
 
@@ -34,3 +38,43 @@ class TestDjangoUserStateClient(UserStateClientTestBase, ModuleStoreTestCase):
         super(TestDjangoUserStateClient, self).setUp()
         self.client = DjangoXBlockUserStateClient()
         self.users = defaultdict(UserFactory.create)
+
+
+class TestDjangoUserStateClientSetMany(TestCase):
+    """
+    Tests of the queries made by DjangoXBlockUserStateClient.set_many.
+    """
+    # Tell Django to clean out all databases, not just default
+    multi_db = True
+
+    def setUp(self):
+        super(TestDjangoUserStateClientSetMany, self).setUp()
+        self.user = UserFactory.create()
+        self.client = DjangoXBlockUserStateClient(self.user)
+        course_key = CourseLocator('org', 'course', 'run')
+        self.existing_keys = [course_key.make_usage_key('problem', 'existing_{}'.format(i)) for i in range(2)]
+        self.missing_key = course_key.make_usage_key('problem', 'missing')
+        for usage_key in self.existing_keys:
+            StudentModuleFactory.create(
+                student=self.user,
+                course_id=course_key,
+                module_state_key=usage_key,
+                state=json.dumps({'a_field': 'a_value'}),
+            )
+
+    def test_set_many_existing_and_missing(self):
+        block_keys_to_state = {usage_key: {'b_field': 'b_value'} for usage_key in self.existing_keys}
+        block_keys_to_state[self.missing_key] = {'b_field': 'b_value'}
+
+        # A single SELECT loads the existing rows, then each block is updated or
+        # created in its own savepoint (3 queries each), and each write records
+        # a history entry.
+        with self.assertNumQueries(1 + 3 * len(block_keys_to_state), using='default'):
+            with self.assertNumQueries(len(block_keys_to_state), using='student_module_history'):
+                self.client.set_many(self.user.username, block_keys_to_state)
+
+        for usage_key in self.existing_keys:
+            student_module = StudentModule.objects.get(student=self.user, module_state_key=usage_key)
+            self.assertEqual(json.loads(student_module.state), {'a_field': 'a_value', 'b_field': 'b_value'})
+        student_module = StudentModule.objects.get(student=self.user, module_state_key=self.missing_key)
+        self.assertEqual(json.loads(student_module.state), {'b_field': 'b_value'})
@@ -94,12 +94,19 @@ class DjangoXBlockUserStateClient(XBlockUserStateClient):
             course_key_func,
         )
 
+        # Filter directly on the student id when we already have the user loaded,
+        # rather than joining against auth_user to match on the username.
+        if self.user is not None and self.user.is_authenticated and self.user.username == username:
+            student_filter = {'student': self.user}
+        else:
+            student_filter = {'student__username': username}
+
         for course_key, usage_keys in by_course:
             query = StudentModule.objects.chunked_filter(
                 'module_state_key__in',
                 usage_keys,
-                student__username=username,
                 course_id=course_key,
+                **student_filter
             )
 
             for student_module in query:
@@ -227,7 +234,7 @@ class DjangoXBlockUserStateClient(XBlockUserStateClient):
         # count how many times this function gets called
         self._nr_stat_increment('set_many', 'calls')
 
-        # We do a find_or_create for every block (rather than re-using field objects
+        # We re-read the rows for these blocks (rather than re-using field objects
         # that were queried in get_many) so that if the score has
         # been changed by some other piece of the code, we don't overwrite
         # that score.
@@ -243,26 +250,36 @@ class DjangoXBlockUserStateClient(XBlockUserStateClient):
 
         evt_time = time()
 
+        # Load all of the existing rows with a single query, rather than a
+        # lookup per block. Missing rows are still created one at a time, so
+        # that the StudentModule post_save history receivers run for them.
+        existing_modules = {
+            usage_key: student_module
+            for student_module, usage_key in self._get_student_modules(username, list(block_keys_to_state))
+        }
+
         for usage_key, state in block_keys_to_state.items():
-            try:
-                student_module, created = StudentModule.objects.get_or_create(
-                    student=user,
-                    course_id=usage_key.course_key,
-                    module_state_key=usage_key,
-                    defaults={
-                        'state': json.dumps(state),
-                        'module_type': usage_key.block_type,
-                    },
-                )
-            except IntegrityError:
-                # PLAT-1109 - Until we switch to read committed, we cannot rely
-                # on get_or_create to be able to see rows created in another
-                # process. This seems to happen frequently, and ignoring it is the
-                # best course of action for now
-                log.warning(u"set_many: IntegrityError for student {} - course_id {} - usage key {}".format(
-                    user, repr(six.text_type(usage_key.course_key)), usage_key
-                ))
-                return
+            student_module = existing_modules.get(usage_key)
+            created = student_module is None
+            if created:
+                try:
+                    with transaction.atomic():
+                        student_module = StudentModule.objects.create(
+                            student=user,
+                            course_id=usage_key.course_key,
+                            module_state_key=usage_key,
+                            state=json.dumps(state),
+                            module_type=usage_key.block_type,
+                        )
+                except IntegrityError:
+                    # PLAT-1109 - Until we switch to read committed, we cannot rely
+                    # on the query above to be able to see rows created in another
+                    # process. This seems to happen frequently, and ignoring it is the
+                    # best course of action for now
+                    log.warning(u"set_many: IntegrityError for student {} - course_id {} - usage key {}".format(
+                        user, repr(six.text_type(usage_key.course_key)), usage_key
+                    ))
+                    return
 
             num_fields_before = num_fields_after = num_new_fields_set = len(state)
             num_fields_updated = 0
@@ -278,7 +295,8 @@ class DjangoXBlockUserStateClient(XBlockUserStateClient):
                 try:
                     with transaction.atomic():
                         # Updating the object - force_update guarantees no INSERT will occur.
-                        student_module.save(force_update=True)
+                        # Only the state changed, so don't rewrite the grade and key columns.
+                        student_module.save(force_update=True, update_fields=['state', 'modified'])
                 except IntegrityError:
                     # The UPDATE above failed. Log information - but ignore the error.
                     # See https://openedx.atlassian.net/browse/TNL-5365
@@ -338,7 +356,7 @@ class DjangoXBlockUserStateClient(XBlockUserStateClient):
                 student_module.state = json.dumps(current_state)
 
             # We just read this object, so we know that we can do an update
-            student_module.save(force_update=True)
+            student_module.save(force_update=True, update_fields=['state', 'modified'])
 
         # Event for the entire delete_many call.
         finish_time = time()
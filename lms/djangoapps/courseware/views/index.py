@@ -361,7 +361,10 @@ class CoursewareIndex(View):
         """
         child = None
         if url_name:
-            child = parent.get_child_by(lambda m: m.location.block_id == url_name)
+            # Match on the children's usage keys so that only the requested
+            # child is loaded and bound, rather than every sibling scanned.
+            matching_children = parent.get_children(usage_id_filter=lambda key: key.block_id == url_name)
+            child = matching_children[0] if matching_children else None
             if not child:
                 # User may be trying to access a child that isn't live yet
                 if not self._is_masquerading_as_student():
@@ -1360,10 +1360,11 @@ def submission_history(request, course_id, student_username, location):
 
     # This is ugly, but until we have a proper submissions API that we can use to provide
     # the scores instead, it will have to do.
+    # Only the ids are needed to look up the history, so don't load the state.
     csm = StudentModule.objects.filter(
         module_state_key=usage_key,
         student__username=student_username,
-        course_id=course_key)
+        course_id=course_key).only('id')
 
     scores = BaseStudentModuleHistory.get_history(csm)
 
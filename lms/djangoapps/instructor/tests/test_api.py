@@ -70,7 +70,7 @@ from openedx.core.djangoapps.site_configuration import helpers as configuration_
 from openedx.core.djangoapps.site_configuration.tests.mixins import SiteMixin
 from openedx.core.djangoapps.waffle_utils.testutils import override_waffle_flag
 from openedx.core.lib.teams_config import TeamsConfig
-from openedx.core.lib.xblock_utils import grade_histogram
+from openedx.core.lib.xblock_utils import grade_histogram, grade_histograms
 from openedx.features.course_experience import RELATIVE_DATES_FLAG
 from shoppingcart.models import (
     Coupon,
@@ -3723,6 +3723,40 @@ class TestEntranceExamInstructorAPIRegradeTask(SharedModuleStoreTestCase, LoginE
         self.assertEqual(grades[0], (50.0, 1))
         self.assertEqual(grades[1], (100.0, 1))
 
+    @ddt.data(ModuleStoreEnum.Type.split, ModuleStoreEnum.Type.mongo)
+    def test_grade_histograms(self, store):
+        """
+        Verify that histograms for several problems are fetched with a single query.
+        """
+        course = CourseFactory.create(default_store=store)
+
+        first_key = course.id.make_usage_key('problem', 'first_problem')
+        second_key = course.id.make_usage_key('problem', 'second_problem')
+        unattempted_key = course.id.make_usage_key('problem', 'unattempted_problem')
+        for student_id, grade in ((1, 100), (2, 50), (3, 50)):
+            StudentModule.objects.create(student_id=student_id, grade=grade, module_state_key=first_key)
+        StudentModule.objects.create(student_id=1, grade=25, module_state_key=second_key)
+
+        with self.assertNumQueries(1):
+            histograms = grade_histograms([first_key, second_key, unattempted_key])
+        self.assertEqual(histograms[text_type(first_key)], [(50.0, 2), (100.0, 1)])
+        self.assertEqual(histograms[text_type(second_key)], [(25.0, 1)])
+        self.assertEqual(histograms[text_type(unattempted_key)], [])
+
+    def test_grade_histogram_prefetch(self):
+        """
+        Verify that prefetched histograms are served from the request cache.
+        """
+        first_key = self.course.id.make_usage_key('problem', 'first_problem')
+        second_key = self.course.id.make_usage_key('problem', 'second_problem')
+        StudentModule.objects.create(student_id=1, grade=100, module_state_key=first_key)
+        StudentModule.objects.create(student_id=1, grade=25, module_state_key=second_key)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(grade_histogram(first_key, [second_key]), [(100.0, 1)])
+        with self.assertNumQueries(0):
+            self.assertEqual(grade_histogram(second_key), [(25.0, 1)])
+
     def test_reset_entrance_exam_student_attempts_delete_all(self):
         """ Make sure no one can delete all students state on entrance exam. """
         url = reverse('reset_student_attempts_for_entrance_exam',
@@ -177,6 +177,17 @@ class TestXblockUtils(SharedModuleStoreTestCase):
         self.assertIsInstance(test_replace, Fragment)
         self.assertEqual(test_replace.content, anchor_tag)
 
+    @ddt.data('course_mongo', 'course_split')
+    def test_replace_urls_without_matches(self, course_id):
+        """
+        Verify that fragments with no urls to rewrite are returned as-is.
+        """
+        course = getattr(self, course_id)
+        frag = Fragment('<p>No links here</p>')
+        self.assertIs(replace_course_urls(course.id, course, 'baseview', frag, None), frag)
+        self.assertIs(replace_jump_to_id_urls(course.id, '/base_url/', course, 'baseview', frag, None), frag)
+        self.assertIs(replace_static_urls(None, course, 'baseview', frag, None, course_id=course.id), frag)
+
     def test_sanitize_html_id(self):
         """
         Verify that colons and dashes are replaced.
@@ -19,6 +19,7 @@ from django.urls import reverse
 from django.utils.html import escape
 from django.contrib.auth.models import User
 from django.contrib.staticfiles.storage import staticfiles_storage
+from edx_django_utils.cache import RequestCache
 from pytz import UTC
 from edxmako.shortcuts import render_to_string
 from web_fragments.fragment import Fragment
@@ -49,6 +50,16 @@ def wrap_fragment(fragment, new_content):
     return wrapper_frag
 
 
+def _wrap_rewritten_fragment(fragment, new_content):
+    """
+    Like wrap_fragment, but returns `fragment` itself if rewriting its
+    content left it unchanged, so unaffected fragments aren't copied.
+    """
+    if new_content == fragment.content:
+        return fragment
+    return wrap_fragment(fragment, new_content)
+
+
 def request_token(request):
     """
     Return a unique token for the supplied request.
@@ -244,10 +255,13 @@ def replace_jump_to_id_urls(course_id, jump_to_id_base_url, block, view, frag, c
         redirect. e.g. /courses/<org>/<course>/<run>/jump_to_id. NOTE the <id> will be appended to
         the end of this URL at re-write time
 
-    output: a new :class:`~web_fragments.fragment.Fragment` that modifies `frag` with
-        content that has been update with /jump_to_id links replaced
+    output: a :class:`~web_fragments.fragment.Fragment` that modifies `frag` with
+        content that has been update with /jump_to_id links replaced (or `frag`
+        itself, if it had no such links)
     """
-    return wrap_fragment(frag, static_replace.replace_jump_to_id_urls(frag.content, course_id, jump_to_id_base_url))
+    return _wrap_rewritten_fragment(
+        frag, static_replace.replace_jump_to_id_urls(frag.content, course_id, jump_to_id_base_url)
+    )
 
 
 def replace_course_urls(course_id, block, view, frag, context):  # pylint: disable=unused-argument
@@ -256,7 +270,7 @@ def replace_course_urls(course_id, block, view, frag, context):  # pylint: disab
     the old get_html function and substitutes urls of the form /course/...
     with urls that are /courses/<course_id>/...
     """
-    return wrap_fragment(frag, static_replace.replace_course_urls(frag.content, course_id))
+    return _wrap_rewritten_fragment(frag, static_replace.replace_course_urls(frag.content, course_id))
 
 
 def replace_static_urls(data_dir, block, view, frag, context, course_id=None, static_asset_path=''):  # pylint: disable=unused-argument
@@ -265,7 +279,7 @@ def replace_static_urls(data_dir, block, view, frag, context, course_id=None, st
     the old get_html function and substitutes urls of the form /static/...
     with urls that are /static/<prefix>/...
     """
-    return wrap_fragment(frag, static_replace.replace_static_urls(
+    return _wrap_rewritten_fragment(frag, static_replace.replace_static_urls(
         frag.content,
         data_dir,
         course_id,
@@ -273,31 +287,65 @@ def replace_static_urls(data_dir, block, view, frag, context, course_id=None, st
     ))
 
 
-def grade_histogram(module_id):
+def grade_histogram(module_id, prefetch_module_ids=()):
     '''
     Print out a histogram of grades on a given problem in staff member debug info.
 
+    Histograms for `prefetch_module_ids` are fetched in the same query and kept
+    for the rest of the request, so a staff page rendering several problems
+    only queries once.
+
     Warning: If a student has just looked at an xmodule and not attempted
     it, their grade is None. Since there will always be at least one such student
     this function almost always returns [].
     '''
+    request_cache = RequestCache('grade_histograms')
+    cached_response = request_cache.get_cached_response(text_type(module_id))
+    if cached_response.is_found:
+        return cached_response.value
+
+    histograms = grade_histograms([module_id] + list(prefetch_module_ids))
+    for histogram_module_id, histogram in histograms.items():
+        request_cache.set(histogram_module_id, histogram)
+    return histograms[text_type(module_id)]
+
+
+def grade_histograms(module_ids):
+    '''
+    Return the grade histograms for several problems using a single query.
+
+    Returns a dict mapping each module id (as text) to the list of (grade, count)
+    tuples that grade_histogram would return for it, ordered by grade.
+    '''
     from django.db import connection
-    cursor = connection.cursor()
 
+    module_ids = [text_type(module_id) for module_id in module_ids]
+    histograms = {module_id: [] for module_id in module_ids}
+    if not module_ids:
+        return histograms
+
+    cursor = connection.cursor()
     query = u"""\
-        SELECT courseware_studentmodule.grade,
+        SELECT courseware_studentmodule.module_id,
+        courseware_studentmodule.grade,
         COUNT(courseware_studentmodule.student_id)
         FROM courseware_studentmodule
-        WHERE courseware_studentmodule.module_id=%s
-        GROUP BY courseware_studentmodule.grade"""
-    # Passing module_id this way prevents sql-injection.
-    cursor.execute(query, [text_type(module_id)])
+        WHERE courseware_studentmodule.module_id IN ({placeholders})
+        GROUP BY courseware_studentmodule.module_id, courseware_studentmodule.grade
+        ORDER BY courseware_studentmodule.module_id, courseware_studentmodule.grade""".format(
+        placeholders=u', '.join([u'%s'] * len(module_ids))
+    )
+    # Passing module_ids this way prevents sql-injection.
+    cursor.execute(query, module_ids)
+
+    for module_id, grade, count in cursor.fetchall():
+        histograms.setdefault(module_id, []).append((grade, count))
 
-    grades = list(cursor.fetchall())
-    grades.sort(key=lambda x: x[0])  # Add ORDER BY to sql query?
-    if len(grades) >= 1 and grades[0][0] is None:
-        return []
-    return grades
+    # NULL grades sort first; see the warning in grade_histogram.
+    for module_id, grades in histograms.items():
+        if grades and grades[0][0] is None:
+            histograms[module_id] = []
+    return histograms
 
 
 def sanitize_html_id(html_id):
@@ -345,9 +393,19 @@ def add_staff_markup(user, disable_staff_debug_info, block, view, frag, context)
     if isinstance(block, SequenceModule) or getattr(block, 'HIDDEN', False):
         return frag
 
+    # staff_problem_info.html skips the staff debug panel, with the field values
+    # and the histogram, for detached blocks, so only read the fields and query
+    # the histogram when it will be shown.
+    tags = block._class_tags  # pylint: disable=protected-access
+    render_debug_info = 'detached' not in tags
+
     block_id = block.location
-    if block.has_score and settings.FEATURES.get('DISPLAY_HISTOGRAMS_TO_STAFF'):
-        histogram = grade_histogram(block_id)
+    if render_debug_info and block.has_score and settings.FEATURES.get('DISPLAY_HISTOGRAMS_TO_STAFF'):
+        # Siblings are usually rendered next, so fetch their histograms along with
+        # this one. Only look at the parent if it's already loaded.
+        parent = block.get_parent() if block.has_cached_parent else None
+        sibling_ids = [child for child in parent.children if child != block_id] if parent else []
+        histogram = grade_histogram(block_id, sibling_ids)
         render_histogram = len(histogram) > 0
     else:
         histogram = None
@@ -382,17 +440,18 @@ def add_staff_markup(user, disable_staff_debug_info, block, view, frag, context)
         is_released = "<font color='red'>Yes!</font>" if (now > mstart) else "<font color='green'>Not yet</font>"
 
     field_contents = []
-    for name, field in block.fields.items():
-        try:
-            field_contents.append((name, field.read_from(block)))
-        except InvalidScopeError:
-            log.warning("Unable to read field in Staff Debug information", exc_info=True)
-            field_contents.append((name, "WARNING: Unable to read field"))
+    if render_debug_info:
+        for name, field in block.fields.items():
+            try:
+                field_contents.append((name, field.read_from(block)))
+            except InvalidScopeError:
+                log.warning("Unable to read field in Staff Debug information", exc_info=True)
+                field_contents.append((name, "WARNING: Unable to read field"))
 
     staff_context = {
         'fields': field_contents,
         'xml_attributes': getattr(block, 'xml_attributes', {}),
-        'tags': block._class_tags,  # pylint: disable=protected-access
+        'tags': tags,
         'location': block.location,
         'xqa_key': block.xqa_key,
         'source_file': source_file,